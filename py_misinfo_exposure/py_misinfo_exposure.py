@@ -11,18 +11,107 @@ which does the same thing and is based on Mosleh and Rand's paper (2021).
 
 Author: Matthew R. DeVerna (https://github.com/mr-devs)
 """
+import ast
+import asyncio
+import functools
+import itertools
+import json
+import numbers
 import os
 import pkg_resources
+import sqlite3
+import threading
+import time
 import warnings
-from collections import defaultdict
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from contextlib import closing
 
 import tweepy
+import numpy as np
 import pandas as pd
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 
 DATA_FILE_PATH = pkg_resources.resource_filename(
     'py_misinfo_exposure', 'data/falsity_scores.csv'
 )
+FOLLOWING_ENDPOINT = "https://api.twitter.com/2/users/{}/following"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_falsity_data():
+    """
+    Load the falsity data once per process.
+
+    Only the columns needed to calculate scores are kept. Elites are not
+    deduplicated because some of them appear more than once with different
+    falsity scores, and every row counts towards a user's score.
+
+    Note: the returned dataframe is shared by all PyMisinfoExposure instances
+    and should not be modified in place.
+
+    Returns:
+    ----------
+    - falsity_data (pandas.core.frame.DataFrame) : a dataframe with a single
+        `falsity` column, indexed by `elite_id_str` (int64)
+    """
+
+    # Retrieved from: https://github.com/mmosleh/minfo-exposure/tree/main/data
+    return pd.read_csv(
+        DATA_FILE_PATH,
+        usecols = ["elite_id_str", "falsity"],
+        dtype = {
+            "elite_id_str" : "int64",
+            "falsity" : float
+        }
+    ).set_index("elite_id_str")
+
+
+def _check_user_id_list(lst, name):
+    """
+    Raise an error if `lst` is not a list of string or integer user IDs.
+
+    Parameters:
+    ----------
+    - lst (list) : the list of Twitter user IDs to check
+    - name (str) : the name of the checked argument, used in the error message
+
+    Returns:
+    ----------
+    - user_ids (list) : the user IDs in `lst`, all converted to strings
+
+    Exceptions:
+    ----------
+    - TypeError
+    """
+
+    if not isinstance(lst, list):
+        raise TypeError(f"`{name}` must be a list.")
+
+    user_ids = []
+    bad = []
+    for idx, uid in enumerate(lst):
+        if isinstance(uid, str):
+            user_ids.append(uid)
+        elif isinstance(uid, numbers.Integral) and not isinstance(uid, bool):
+            user_ids.append(str(uid))
+        else:
+            bad.append((idx, uid))
+
+    if bad:
+        out_string = "\n\nNon-string/integer user IDs and corresponding indices:\n"
+        for idx, uid in bad:
+            out_string += f"\tProvided ID: {uid} | List index: {idx}\n"
+        raise TypeError("Some user IDs are not strings or integers..." + out_string)
+
+    return user_ids
+
 
 class PyMisinfoExposure:
     
@@ -32,7 +121,11 @@ class PyMisinfoExposure:
         verbose: bool = False,
         update_on: int = 25,
         save_friends_to_disk: bool = False,
-        output_dir: str = "py_misinfo_friend_data"
+        output_dir: str = "py_misinfo_friend_data",
+        max_workers: int = 8,
+        use_async: bool = False,
+        cache_path: str = None,
+        cache_ttl_days: float = 14
     ):
         # Check input types
         if bearer_token is None:
@@ -45,6 +138,23 @@ class PyMisinfoExposure:
             raise ValueError("`save_friends_to_disk` must be of type `bool`")
         if not isinstance(output_dir, str):
             raise ValueError("`output_dir` must be of type `str`")
+        if not isinstance(max_workers, int) or isinstance(max_workers, bool):
+            raise ValueError("`max_workers` must be of type `int`")
+        if max_workers < 1:
+            raise ValueError("`max_workers` must be at least 1")
+        if not isinstance(use_async, bool):
+            raise ValueError("`use_async` must be of type `bool`")
+        if use_async and aiohttp is None:
+            raise ImportError(
+                "`use_async=True` requires the `aiohttp` package. "
+                "Install it with `pip install py_misinfo_exposure[async]`."
+            )
+        if (cache_path is not None) and (not isinstance(cache_path, str)):
+            raise ValueError("`cache_path` must be of type `str` or `None`")
+        if not isinstance(cache_ttl_days, (int, float)) or isinstance(cache_ttl_days, bool):
+            raise ValueError("`cache_ttl_days` must be of type `int` or `float`")
+        if cache_ttl_days < 0:
+            raise ValueError("`cache_ttl_days` must be at least 0")
 
         self._bearer_token = bearer_token
         self._verbose = verbose
@@ -52,18 +162,21 @@ class PyMisinfoExposure:
         self._save_friends_to_disk = save_friends_to_disk
         self._client = None
         self._output_dir = output_dir
+        self._max_workers = max_workers
+        self._use_async = use_async
+        self._cache_path = cache_path
+        self._cache_ttl_days = cache_ttl_days
 
-        # Load falsity data.
-        # Retrieved from: https://github.com/mmosleh/minfo-exposure/tree/main/data
-        self.falsity_data = pd.read_csv(
-            DATA_FILE_PATH,
-            dtype = {
-                "elite_account" : str,
-                "pf_score" : float,
-                "elite_id_str" : str,
-                "falsity" : float
-            }
-        )
+        # Load falsity data (indexed by `elite_id_str`)
+        self.falsity_data = _load_falsity_data()
+
+        # Some elites appear more than once in the falsity data, and every falsity
+        # score for an elite is counted. So, for each unique elite we store the sum and
+        # count of their falsity scores as NumPy arrays, looked up by integer position
+        falsity_totals = self.falsity_data["falsity"].groupby(level=0).agg(["sum", "count"])
+        self._elite_index = falsity_totals.index
+        self._falsity_sums = falsity_totals["sum"].to_numpy(dtype="float64")
+        self._falsity_counts = falsity_totals["count"].to_numpy(dtype="float64")
 
 
     def tweepy_bearer_authorization(self):
@@ -71,8 +184,11 @@ class PyMisinfoExposure:
         Authorize the Tweepy package using your developer bearer token.
 
         Note on Twitter API rate limiting:
-            This function automatically waits the proper amount of time when Twitter
-            sends a rate limit error.
+            The client does not wait on rate limits itself. Instead, `_fetch_one` waits
+            the proper amount of time when Twitter sends a rate limit error, so that a
+            manual abort can interrupt the wait.
+
+        Note: the client returns the raw JSON response of each request as a dict.
 
         References:
         - Tweepy: https://www.tweepy.org/
@@ -97,43 +213,41 @@ class PyMisinfoExposure:
                 "Please reinitialize the PyMisinfoExposure class with a string type bearer token."
             )
 
-        self._client = tweepy.Client(bearer_token=self._bearer_token, wait_on_rate_limit=True)
+        # Responses are returned as plain dicts so that Tweepy does not build a
+        # `tweepy.User` object for every friend; only their IDs are used
+        self._client = tweepy.Client(
+            bearer_token=self._bearer_token, wait_on_rate_limit=False, return_type=dict
+        )
 
 
-    def _get_users_data(self, user_id_list=list) -> pd.core.frame.DataFrame:
+    def _get_users_data(self, user_id_list=list) -> tuple:
         """
         Return user info needed for `get_misinfo_exposure_score`.
 
         Parameters:
         ----------
-        - user_id_list (str) : the list of unique Twitter user IDs for which you'd like data.
+        - user_id_list (list) : the list of unique Twitter user IDs (str) for which you'd like data.
+            Note: the list is expected to have already passed `_check_user_id_list`
         - client (tweepy.client.Client) : a Tweepy api client that allows one to gather Twitter data
 
         Returns:
         ----------
-        results = (list) : a list of tuples where each item is:
-            ('queried_user', 'friend_id', 'friend_name', 'friend_username')
+        - users (list) : the queried user for each friend in `friend_ids`
+        - friend_ids (list) : the ID (int) of each friend, aligned by position with `users`
+            Note: if save_friends_to_disk == True, only the friends needed to calculate
+            scores are included (see `_scoring_friends`)
+        - skipped_users (set) : users whose friends were already saved in self._output_dir
+            and were therefore not pulled again. Empty if save_friends_to_disk == False
 
         Exceptions:
         ----------
         - ValueError
-        - TypeError
         """
 
         # Throw errors if function input is incorrect
         if self._client is None:
             raise ValueError("No Tweepy client provided.")
 
-        if not isinstance(user_id_list, list):
-            raise TypeError(f"`user_id_list` must be a list.")
-
-        if not all(isinstance(uid, str) for uid in user_id_list):
-            out_string = "\n\nNon-string user IDs and corresponding indices:\n"
-            for idx, uid in enumerate(user_id_list):
-                if not isinstance(uid, str):
-                    out_string += f"\tProvided ID: {uid} | List index: {idx}\n"
-            raise TypeError("Some user IDs are not strings..." + out_string)
-
         if self._verbose:
             print(f"Beginning to pull friends for {len(user_id_list):,} users.")
             print(f"Will update on progress every {self._update_on:,} users.")
@@ -144,81 +258,456 @@ class PyMisinfoExposure:
             if self._verbose:
                 print(f"Friends data will be saved here: {self._output_dir}")
 
-        # Gather results
-        results = []
-        for user_count, user in enumerate(user_id_list, start=1):
+        # Users pulled within the last self._cache_ttl_days days are loaded from the
+        # friends cache instead of being pulled from Twitter again
+        cached_friend_ids = {}
+        if self._cache_path is not None:
+            cached_friend_ids = self._read_friends_cache(user_id_list)
+            if self._verbose:
+                print(f"Friends for {len(cached_friend_ids):,} users loaded from: {self._cache_path}")
+        users_to_fetch = [user for user in user_id_list if user not in cached_friend_ids]
+
+        # Gather results. Both collectors overlap the (network-bound) Twitter API
+        # requests for different users: aiohttp does so on a single thread, while
+        # the default Tweepy collector handles each user in its own worker thread
+        if self._use_async:
+            try:
+                friend_id_lists = asyncio.run(self._fetch_all_async(users_to_fetch))
+            except KeyboardInterrupt:
+                raise Exception("MANUAL ABORT!!!\n\n")
+
+        else:
+            friend_id_lists = []
+            stop_event = threading.Event()
+            executor = ThreadPoolExecutor(max_workers=self._max_workers)
+            futures = [
+                executor.submit(self._fetch_one, user, stop_event) for user in users_to_fetch
+            ]
+            try:
+                for user_count, future in enumerate(futures, start=1):
+                    # Wait with a timeout so that a manual abort is not delayed until
+                    # the current user has been processed. The result is only taken
+                    # once the user is done, so errors raised by workers are re-raised
+                    while not wait([future], timeout=0.5).done:
+                        continue
+                    friend_id_lists.append(future.result())
+
+                    if self._verbose and (user_count % self._update_on == 0):
+                        print(f"{user_count} users processed...")
+
+            except KeyboardInterrupt:
+                raise Exception("MANUAL ABORT!!!\n\n")
+
+            finally:
+                # Stop any users that have not been started yet (e.g., after an error)
+                # and tell running workers to stop. Workers stop once their current
+                # request returns, or right away if they are waiting on a rate limit
+                stop_event.set()
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=False)
+
+        fetched_friend_ids = dict(zip(users_to_fetch, friend_id_lists))
+
+        users = []
+        friend_ids = []
+        skipped_users = set()
+        for user in user_id_list:
+            if user in cached_friend_ids:
+                user_friend_ids = cached_friend_ids[user]
+                if self._save_friends_to_disk:
+                    user_friend_ids = self._scoring_friends(user_friend_ids)
+            else:
+                user_friend_ids = fetched_friend_ids[user]
 
-            ### Get friends data ###
+            if user_friend_ids is None:
+                skipped_users.add(user)
+                continue
+            users.extend([user] * len(user_friend_ids))
+            friend_ids.extend(user_friend_ids)
 
-            # If save_friends_to_disk == True, we write these results to the disk
-            if self._save_friends_to_disk:
-                out_path = os.path.join(self._output_dir, f"{user}_data.txt")
+        return users, friend_ids, skipped_users
 
-                try:
-                    if os.path.exists(out_path):
-                        if self._verbose:
-                            print(
-                                f"\t - Data for user ({user}) already exists, so we will "
-                                "skip this user. If you think this is a mistake and want to "
-                                f"gather data for this user, delete this user's file ({out_path}) and rerun."
-                            )
-                        continue
 
-                    with open(out_path, "w") as f:
-                        for friend in tweepy.Paginator(self._client.get_users_following, id=user, max_results=1000).flatten():
-                            friend_info = tuple([user] + list(friend.values()))
-                            f.write(f"{friend_info}\n")
+    def _fetch_one(self, user: str, stop_event: threading.Event) -> list:
+        """
+        Pull all friends for a single user with Tweepy.
 
-                except KeyboardInterrupt:
-                    except_string = "MANUAL ABORT!!!\n\n"
-                    except_string += f"WARNING: this file {out_path} may be incomplete!!!"
-                    raise Exception(except_string)
+        Note on Twitter API rate limiting:
+            When Twitter sends a rate limit error (429), this function waits until the
+            rate limit resets (or `stop_event` is set) and then retries the request.
 
-            # Otherwise, we save the data in working memory
-            else:
-                for friend in tweepy.Paginator(self._client.get_users_following, id=user, max_results=1000).flatten():
-                    friend_info = tuple([user] + list(friend.values()))
-                    results.append(friend_info)
+        Parameters:
+        ----------
+        - user (str) : the Twitter user ID for which you'd like data.
+        - stop_event (threading.Event) : when set, the user is abandoned before the
+            next page of friends is requested and None is returned. Setting it also
+            ends any wait on a rate limit
+
+        Returns:
+        ----------
+        - friend_ids (list, None) : the unique IDs (int) of the user's friends
+            Note: if save_friends_to_disk == True, all friends are written to this
+            user's file in self._output_dir and only the friends needed to calculate
+            scores are returned. If that file already exists, None is returned
+        """
+
+        if self._save_friends_to_disk and self._is_cached(user):
+            return None
+
+        # Only the friend IDs are kept from each (raw JSON) page of results
+        friend_ids = []
+        params = {"id": user, "max_results": 1000}
+        while not stop_event.is_set():
+            try:
+                page = self._client.get_users_following(**params)
+            except tweepy.TooManyRequests as e:
+                reset = int(e.response.headers.get("x-rate-limit-reset", time.time()))
+                wait_time = max(reset - time.time(), 0) + 1
+                if self._verbose:
+                    print(f"Rate limit reached. Sleeping for {wait_time:.0f} seconds.")
+                stop_event.wait(wait_time)
+                continue
+
+            friend_ids.extend(int(friend["id"]) for friend in page.get("data", []))
+
+            next_token = page.get("meta", {}).get("next_token")
+            if next_token is None:
+                return self._store_friends(user, friend_ids)
+            params["pagination_token"] = next_token
+
+        return None
 
+
+    async def _fetch_all_async(self, user_id_list: list) -> list:
+        """
+        Pull all friends for every user in `user_id_list` concurrently with aiohttp.
+
+        At most self._max_workers requests are in flight at the same time.
+
+        Parameters:
+        ----------
+        - user_id_list (list) : the list of unique Twitter user IDs for which you'd like data.
+
+        Returns:
+        ----------
+        - friend_id_lists (list) : the output of `_fetch_one_async` for each user,
+            aligned by position with `user_id_list`
+        """
+
+        semaphore = asyncio.Semaphore(self._max_workers)
+        headers = {"Authorization": f"Bearer {self._bearer_token}"}
+        user_count = 0
+
+        async def fetch(session, user):
+            nonlocal user_count
+            user_friend_ids = await self._fetch_one_async(session, semaphore, user)
+
+            user_count += 1
             if self._verbose and (user_count % self._update_on == 0):
                 print(f"{user_count} users processed...")
 
-        return results
+            return user_friend_ids
+
+        async with aiohttp.ClientSession(headers=headers) as session:
+            return await asyncio.gather(*[fetch(session, user) for user in user_id_list])
 
 
-    def _load_cached_friend_data(self):
+    async def _fetch_one_async(self, session, semaphore, user: str) -> list:
         """
-        Load all individual friend data files in self._output_dir
+        Pull all friends for a single user by paginating the Twitter V2 following endpoint.
+
+        Note on Twitter API rate limiting:
+            When Twitter sends a rate limit error (429), this function waits until the
+            rate limit resets and then retries the request.
+
+        Parameters:
+        ----------
+        - session (aiohttp.ClientSession) : a session authorized with the bearer token
+        - semaphore (asyncio.Semaphore) : limits the number of requests in flight
+        - user (str) : the Twitter user ID for which you'd like data.
 
         Returns:
         ----------
-        - results = (list) : a list of tuples where each item is:
+        - friend_ids (list, None) : the unique IDs (int) of the user's friends
+            Note: if save_friends_to_disk == True, all friends are written to this
+            user's file in self._output_dir and only the friends needed to calculate
+            scores are returned. If that file already exists, None is returned
+
+        Exceptions:
+        ----------
+        - aiohttp.ClientResponseError
+        """
+
+        if self._save_friends_to_disk and self._is_cached(user):
+            return None
+
+        friend_ids = []
+        params = {"max_results": 1000}
+        url = FOLLOWING_ENDPOINT.format(user)
+        while True:
+            async with semaphore:
+                async with session.get(url, params=params) as response:
+                    if response.status == 429:
+                        # Retry-After may also be an HTTP date, in which case the
+                        # rate limit reset time is used instead
+                        try:
+                            retry_after = float(response.headers["Retry-After"])
+                        except (KeyError, ValueError):
+                            reset = int(response.headers.get("x-rate-limit-reset", time.time()))
+                            retry_after = reset - time.time()
+                        payload = None
+                    else:
+                        response.raise_for_status()
+                        payload = await response.json()
+
+            # Wait outside of the semaphore so other users are not blocked
+            if payload is None:
+                wait_time = max(retry_after, 0) + 1
+                if self._verbose:
+                    print(f"Rate limit reached. Sleeping for {wait_time:.0f} seconds.")
+                await asyncio.sleep(wait_time)
+                continue
+
+            friend_ids.extend(int(friend["id"]) for friend in payload.get("data", []))
+
+            next_token = payload.get("meta", {}).get("next_token")
+            if next_token is None:
+                break
+            params["pagination_token"] = next_token
+
+        # Saving friends is blocking file/SQLite I/O, so it runs in a worker thread
+        # to avoid stalling the other users' requests on the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._store_friends, user, friend_ids)
+
+
+    def _store_friends(self, user: str, friend_ids: list) -> list:
+        """
+        Deduplicate and save the friends pulled for a single user.
+
+        Parameters:
+        ----------
+        - user (str) : the Twitter user ID the friends were pulled for
+        - friend_ids (list) : the IDs (int) of the user's friends, from all pages of results
+
+        Returns:
+        ----------
+        - friend_ids (list) : the unique IDs (int) of the user's friends
+            Note: if save_friends_to_disk == True, all friends are written to this
+            user's file in self._output_dir and only the friends needed to calculate
+            scores are returned
+        """
+
+        # Friends are only recorded once per user, in case the same friend
+        # is returned on more than one page
+        friend_ids = list(dict.fromkeys(friend_ids))
+        if self._cache_path is not None:
+            self._write_friends_cache(user, friend_ids)
+
+        # If save_friends_to_disk == True, we write these results to the disk
+        if self._save_friends_to_disk:
+            self._write_friends_file(user, friend_ids)
+            return self._scoring_friends(friend_ids)
+
+        # Otherwise, we save the data in working memory
+        return friend_ids
+
+
+    def _is_cached(self, user: str) -> bool:
+        """
+        Return True if `user`'s friends have already been saved in self._output_dir.
+        """
+
+        out_path = self._friends_file_path(user)
+        if not os.path.exists(out_path):
+            legacy_path = os.path.join(self._output_dir, f"{user}_data.txt")
+            if not os.path.exists(legacy_path):
+                return False
+            self._convert_legacy_friends_file(user, legacy_path)
+
+        if self._verbose:
+            print(
+                f"\t - Data for user ({user}) already exists, so we will "
+                "skip this user. If you think this is a mistake and want to "
+                f"gather data for this user, delete this user's file ({out_path}) and rerun."
+            )
+        return True
+
+
+    def _write_friends_file(self, user: str, friend_ids: list):
+        """
+        Write `user`'s friends to their file in self._output_dir.
+
+        The friends are first written to a temporary file, which is then renamed, so
+        an interrupted write never leaves an incomplete file behind.
+        """
+
+        out_path = self._friends_file_path(user)
+        tmp_path = f"{out_path}.tmp"
+        with open(tmp_path, "w") as f:
+            for friend_id in friend_ids:
+                f.write(f"{user},{friend_id}\n")
+        os.replace(tmp_path, out_path)
+
+
+    def _convert_legacy_friends_file(self, user: str, legacy_path: str):
+        """
+        Convert a `{user}_data.txt` file written by older versions of this package to
+        the current format, so users pulled by those versions are not pulled again.
+
+        Each line of those files is a tuple like:
             ('queried_user', 'friend_id', 'friend_name', 'friend_username')
-            Note: This will include all data for all files with any data
         """
 
-        results = []
-        files = os.listdir(self._output_dir)
-        all_elites = list(self.falsity_data["elite_id_str"])
+        friend_ids = []
+        with open(legacy_path, "r") as f:
+            for line in f:
+                friend_ids.append(int(ast.literal_eval(line)[1]))
+
+        self._write_friends_file(user, list(dict.fromkeys(friend_ids)))
+
+
+    def _connect_friends_cache(self) -> sqlite3.Connection:
+        """
+        Open the friends cache at self._cache_path, creating its table if needed.
+
+        A new connection is opened for every call because friends are cached from
+        several worker threads.
+        """
+
+        conn = sqlite3.connect(self._cache_path, timeout=60)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS friends (user TEXT PRIMARY KEY, ts REAL, ids BLOB)"
+        )
+        return conn
+
+
+    def _read_friends_cache(self, user_id_list: list) -> dict:
+        """
+        Load cached friends for the users in `user_id_list`.
+
+        Parameters:
+        ----------
+        - user_id_list (list) : the list of unique Twitter user IDs for which you'd like data.
+
+        Returns:
+        ----------
+        - cached_friend_ids (dict) : {user : friend_ids} for every user whose friends were
+            cached less than self._cache_ttl_days days ago
+        """
+
+        oldest_ts = time.time() - self._cache_ttl_days * 24 * 60 * 60
+        cached_friend_ids = {}
 
-        for file in files:
-            allow_non_elites = True
-            file_to_load = os.path.join(self._output_dir, file)
+        with closing(self._connect_friends_cache()) as conn:
+            for user in user_id_list:
+                row = conn.execute(
+                    "SELECT ids FROM friends WHERE user = ? AND ts >= ?", (user, oldest_ts)
+                ).fetchone()
+                if row is not None:
+                    cached_friend_ids[user] = json.loads(zlib.decompress(row[0]))
 
-            with open(file_to_load, "r") as f:
-                for line in f:
-                    queried_user, friend_uid, name, username = eval(line)
+        return cached_friend_ids
 
-                    # The below conditional allows friends which are elites, as well as
-                    # the first non-elite friend. This allows us to tell the difference
-                    # between users who we couldn't find data for (will be returned as
-                    # 'missing_users') and users which are returned as NaN b/c they
-                    # don't match any elites.
-                    if (str(friend_uid) in all_elites) or (allow_non_elites == True):
-                        results.append( (queried_user, friend_uid, name, username) )
-                        allow_non_elites = False
 
-        return results
+    def _write_friends_cache(self, user: str, friend_ids: list):
+        """
+        Save `user`'s friends to the friends cache as compressed JSON.
+        """
+
+        ids = zlib.compress(json.dumps(friend_ids).encode())
+        with closing(self._connect_friends_cache()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO friends (user, ts, ids) VALUES (?, ?, ?)",
+                (user, time.time(), ids)
+            )
+
+
+    def _scoring_mask(self, friend_ids) -> np.ndarray:
+        """
+        Return a boolean mask of the friends needed to calculate a user's score: all
+        elites, as well as the first friend. Keeping the first friend allows us to tell
+        the difference between users who we couldn't find data for (will be returned as
+        'missing_users') and users which are returned as NaN b/c they don't match any elites.
+        """
+        keep = self._elite_index.get_indexer(friend_ids) >= 0
+        keep[:1] = True
+        return keep
+
+
+    def _scoring_friends(self, friend_ids: list) -> list:
+        """
+        Return the friends in `friend_ids` that are kept by `_scoring_mask`.
+        """
+        return list(itertools.compress(friend_ids, self._scoring_mask(friend_ids)))
+
+
+    def _friends_file_path(self, user: str) -> str:
+        """
+        Return the path of the file where `user`'s friends are saved in self._output_dir.
+        """
+        return os.path.join(self._output_dir, f"{user}_data.csv")
+
+
+    def _read_friends_file(self, user: str):
+        """
+        Load a single friend data file written by `_fetch_one`.
+
+        Parameters:
+        ----------
+        - user (str) : the Twitter user ID whose friend data file should be loaded
+
+        Returns:
+        ----------
+        - user_pairs (pandas.core.frame.DataFrame, None) : a dataframe with one row per
+            (user, friend_id) pair, or None if the user has no friends
+        """
+
+        # Users without any friends are saved as empty files
+        file_to_load = self._friends_file_path(user)
+        if os.path.getsize(file_to_load) == 0:
+            return None
+
+        # Only the friend IDs are read; the user is already known
+        friend_ids = pd.read_csv(
+            file_to_load,
+            header=None,
+            names=["user", "friend_id"],
+            usecols=["friend_id"],
+            dtype={"friend_id": "int64"}
+        )["friend_id"].to_numpy()
+
+        return pd.DataFrame({
+            "user": user,
+            "friend_id": friend_ids[self._scoring_mask(friend_ids)]
+        })
+
+
+    def _load_cached_friend_data(self, users: list):
+        """
+        Load the friend data files in self._output_dir for `users`
+
+        Parameters:
+        ----------
+        - users (list) : the users whose files should be loaded
+
+        Returns:
+        ----------
+        - pairs (pandas.core.frame.DataFrame) : a dataframe with one row per
+            (user, friend_id) pair needed for scoring `users`
+            Note: Users whose files are empty have no rows
+        """
+
+        # All files are concatenated in a single call. The empty dataframe makes sure
+        # that the columns exist even if no files have any data
+        return pd.concat(
+            itertools.chain(
+                [pd.DataFrame(columns=["user", "friend_id"]).astype({"user": str, "friend_id": "int64"})],
+                (self._read_friends_file(user) for user in users)
+            ),
+            ignore_index=True
+        )
 
 
     def get_misinfo_exposure_score(self, user_id_list=list) -> pd.core.frame.DataFrame:
@@ -228,7 +717,7 @@ class PyMisinfoExposure:
 
         Parameters:
         ----------
-        - user_id_list (str) : the list of unique Twitter user IDs for which you'd like data.
+        - user_id_list (list) : the list of unique Twitter user IDs (str or int) for which you'd like data.
         - client (tweepy.client.Client) : a Tweepy api client that allows one to gather Twitter data
 
         Returns:
@@ -248,47 +737,61 @@ class PyMisinfoExposure:
         if self._client is None:
             raise ValueError("No Tweepy client provided.")
 
-        if not isinstance(user_id_list, list):
-            raise TypeError(f"`user_id_list` must be a list.")
-
-        if not all(isinstance(uid, str) for uid in user_id_list):
-            out_string = "\n\nNon-string user IDs and corresponding indices:\n"
-            for idx, uid in enumerate(user_id_list):
-                if not isinstance(uid, str):
-                    out_string += f"\tProvided ID: {uid} | List index: {idx}\n"
-            raise TypeError("Some user IDs are not strings..." + out_string)
-
-        # Remove duplicate IDs and get all user data
-        user_id_list = list(set(user_id_list))
-        results = self._get_users_data(user_id_list)
-
-        # If the below is true, `results` is currently an empty list so we load the
-        # cached data from self._output_dir and use that
-        if self._save_friends_to_disk:
-            results = self._load_cached_friend_data()
+        user_id_list = _check_user_id_list(user_id_list, "user_id_list")
+
+        # Remove duplicate IDs (keeping the input order) and get all user data
+        user_id_list = list(dict.fromkeys(user_id_list))
+        users, friend_ids, skipped_users = self._get_users_data(user_id_list)
+
+        # Create a long dataframe of (queried_user, friend_id) pairs. Friends are already
+        # unique per user (see `_fetch_one`), so each friend is only counted once.
+        # The friend IDs are converted to an int64 array in one step, rather than
+        # having pandas infer the dtype of each element of the list
+        pairs = pd.DataFrame({
+            "user": users,
+            "friend_id": np.asarray(friend_ids, dtype="int64")
+        })
+
+        # Friends for users that were pulled in an earlier run are only on disk, so we
+        # load just those users' files from self._output_dir
+        if skipped_users:
+            pairs = pd.concat(
+                [pairs, self._load_cached_friend_data(skipped_users)], ignore_index=True
+            )
 
-        # Create dictionary of the following form: {queried_user : list_of_friends}
-        df_dict = defaultdict(list)
-        for queried_user, friend_id, _, _ in results:
-            df_dict[queried_user].append(str(friend_id))
+        # Each user's score is the mean falsity of every elite row they follow, which is
+        # calculated with NumPy from the per-elite falsity sums and counts. Friends are
+        # mapped to their elite's position (-1 if they are not an elite) and users are
+        # mapped to their position in `user_id_list`
+        user_codes = pd.Categorical(pairs["user"], categories=user_id_list).codes
+        positions = self._elite_index.get_indexer(pairs["friend_id"])
+        is_elite = positions >= 0
+        elite_codes = user_codes[is_elite]
+        elite_positions = positions[is_elite]
+
+        num_users = len(user_id_list)
+        falsity_sums = np.bincount(
+            elite_codes, weights=np.take(self._falsity_sums, elite_positions), minlength=num_users
+        )
+        falsity_counts = np.bincount(
+            elite_codes, weights=np.take(self._falsity_counts, elite_positions), minlength=num_users
+        )
 
-        # Get misinformation exposure scores
-        falsity_data = self.falsity_data
-        misinfo_scores = []
-        for user, friends in df_dict.items():
-            misinfo_score = falsity_data[falsity_data["elite_id_str"].isin(friends)].falsity.mean()
-            misinfo_scores.append((user, misinfo_score))
+        # Users who do not follow any elites are returned with a NaN score (0 / 0),
+        # while users without any friends are treated as missing
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = falsity_sums / falsity_counts
+        has_friends = np.bincount(user_codes, minlength=num_users) > 0
 
-        # Convert results to dataframe
-        misinfo_scores_df = pd.DataFrame(misinfo_scores, columns=["user", "misinfo_score"])
-        num_unique_users = misinfo_scores_df.user.nunique()
+        user_index = pd.Index(user_id_list, dtype=str)
+        misinfo_scores_df = pd.DataFrame({
+            "user": user_index[has_friends],
+            "misinfo_score": scores[has_friends]
+        })
 
         # If user IDs are missing, raise a warning
-        user_set = set(user_id_list)
-        missing_users = None
-        if len(user_set) != num_unique_users:
-            users_w_scores = set(misinfo_scores_df.user.unique())
-            missing_users = user_set.difference(users_w_scores)
+        missing_users = set(user_index[~has_friends]) or None
+        if missing_users:
             warning_str = f"\n\nWARNING!! Misinfo. exposure scores missing for {len(missing_users)} users.\n\n"
             warning_str += "Missing users:\n"
             for user in missing_users:
@@ -30,8 +30,12 @@ setup(
     },
     include_package_data = True,
     install_requires=[
-        "tweepy>=4.4.0",
-        "pandas>=1.2.4"
+        "tweepy>=4.12.0",
+        "pandas>=1.2.4",
+        "numpy"
     ],
+    extras_require={
+        "async": ["aiohttp>=3.7"]
+    },
     python_requires=">=3.7",
 )
\ No newline at end of file